@@ -2,7 +2,7 @@
 """Locking primitives"""
 
 import sys
-from gevent.hub import get_hub, getcurrent
+from gevent.hub import get_hub_noargs as get_hub, getcurrent
 from gevent.timeout import Timeout
 
 
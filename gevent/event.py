@@ -2,7 +2,7 @@
 """Basic synchronization primitives: Event and AsyncResult"""
 
 import sys
-from gevent.hub import get_hub, getcurrent, _NONE
+from gevent.hub import get_hub_noargs as get_hub, getcurrent, _NONE
 from gevent.timeout import Timeout
 
 __all__ = ['Event', 'AsyncResult']
@@ -1,7 +1,7 @@
 # Copyright (c) 2009-2012 Denis Bilenko. See LICENSE for details.
 
 import sys
-from gevent.hub import greenlet, getcurrent, get_hub, GreenletExit, Waiter
+from gevent.hub import greenlet, getcurrent, get_hub_noargs as get_hub, GreenletExit, Waiter
 from gevent.timeout import Timeout
 from gevent.six import callable, _meth_self, moves, PY3
 
@@ -81,8 +81,8 @@ class Greenlet(greenlet):
         self._links = []
         self.value = None
         self._exception = _NONE
-        loop = hub.loop
-        self._notifier = loop.callback()
+        # created on demand: most spawned greenlets are never linked to
+        self._notifier = None
         self._start_event = None
 
     @property
@@ -302,8 +302,8 @@ class Greenlet(greenlet):
     def _report_result(self, result):
         self._exception = None
         self.value = result
-        if self._links and not self._notifier.active:
-            self._notifier.start(self._notify_links)
+        if self._links and not self._notifier_active():
+            self._notifier = self.parent.loop.run_callback(self._notify_links)
 
     def _report_error(self, exc_info):
         exception = exc_info[1]
@@ -312,8 +312,8 @@ class Greenlet(greenlet):
             return
         self._exception = exception
 
-        if self._links and not self._notifier.active:
-            self._notifier.start(self._notify_links)
+        if self._links and not self._notifier_active():
+            self._notifier = self.parent.loop.run_callback(self._notify_links)
 
         self.parent.handle_error(self, *exc_info)
 
@@ -342,8 +342,8 @@ class Greenlet(greenlet):
         if not callable(callback):
             raise TypeError('Expected callable: %r' % (callback, ))
         self._links.append(callback)
-        if self.ready() and not self._notifier.active:
-            self._notifier.start(self._notify_links)
+        if self.ready() and not self._notifier_active():
+            self._notifier = self.parent.loop.run_callback(self._notify_links)
 
     def link(self, receiver, SpawnedLink=SpawnedLink):
         """Link greenlet's completion to a callable.
@@ -368,6 +368,9 @@ class Greenlet(greenlet):
         """Like :meth:`link` but *receiver* is only notified when the greenlet dies because of unhandled exception"""
         self.link(receiver=receiver, SpawnedLink=SpawnedLink)
 
+    def _notifier_active(self):
+        return self._notifier is not None and self._notifier.active
+
     def _notify_links(self):
         while self._links:
             link = self._links.pop()
@@ -1,7 +1,7 @@
 # Copyright (c) 2011 Denis Bilenko. See LICENSE for details.
 import os
 import sys
-from _socket import getservbyname, getaddrinfo, gaierror, error
+from _socket import getservbyname, getaddrinfo, gaierror, error, inet_aton, inet_ntoa
 from gevent.hub import Waiter, get_hub, basestring
 from gevent.socket import AF_UNSPEC, AF_INET, AF_INET6, SOCK_STREAM, SOCK_DGRAM, SOCK_RAW, AI_NUMERICHOST, EAI_SERVICE, AI_PASSIVE
 from gevent.ares import channel, InvalidIP
@@ -9,6 +9,8 @@ from gevent.ares import channel, InvalidIP
 
 __all__ = ['Resolver']
 
+_socktype_proto = ((SOCK_STREAM, 6), (SOCK_DGRAM, 17), (SOCK_RAW, 0))
+
 
 class Resolver(object):
 
@@ -42,6 +44,8 @@ class Resolver(object):
 
     def gethostbyname(self, hostname, family=AF_INET):
         hostname = _resolve_special(hostname, family)
+        if family == AF_INET and isinstance(hostname, str) and _is_ipv4_literal(hostname):
+            return hostname
         return self.gethostbyname_ex(hostname, family)[-1][0]
 
     def gethostbyname_ex(self, hostname, family=AF_INET):
@@ -98,17 +102,18 @@ class Resolver(object):
     def _getaddrinfo(self, host, port, family=0, socktype=0, proto=0, flags=0):
         if isinstance(host, unicode):
             host = host.encode('idna')
-        elif not isinstance(host, str) or (flags & AI_NUMERICHOST):
+        elif not isinstance(host, str) or (flags & AI_NUMERICHOST) or _is_ipv4_literal(host):
             # this handles cases which do not require network access
             # 1) host is None
             # 2) host is of an invalid type
             # 3) AI_NUMERICHOST flag is set
+            # 4) host is an IPv4 address
             return getaddrinfo(host, port, family, socktype, proto, flags)
             # we also call _socket.getaddrinfo below if family is not one of AF_*
 
         port, socktype = self._lookup_port(port, socktype)
 
-        socktype_proto = [(SOCK_STREAM, 6), (SOCK_DGRAM, 17), (SOCK_RAW, 0)]
+        socktype_proto = _socktype_proto
         if socktype:
             socktype_proto = [(x, y) for (x, y) in socktype_proto if socktype == x]
         if proto:
@@ -261,6 +266,14 @@ class Values(object):
             raise self.error
 
 
+def _is_ipv4_literal(hostname):
+    # inet_aton() also accepts shorthands like '127.1'; only take the addresses it leaves unchanged
+    try:
+        return inet_ntoa(inet_aton(hostname)) == hostname
+    except (error, TypeError, ValueError):
+        return False
+
+
 def _resolve_special(hostname, family):
     if hostname == '':
         result = getaddrinfo(None, 0, family, SOCK_DGRAM, 0, AI_PASSIVE)
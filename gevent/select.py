@@ -2,7 +2,7 @@
 import sys
 from gevent.timeout import Timeout
 from gevent.event import Event
-from gevent.hub import get_hub
+from gevent.hub import get_hub_noargs as get_hub
 
 __implements__ = ['select']
 __all__ = ['error'] + __implements__
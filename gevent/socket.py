@@ -81,7 +81,7 @@ __imports__ = ['error',
 
 import sys
 import time
-from gevent.hub import get_hub, basestring
+from gevent.hub import get_hub_noargs as get_hub, basestring
 from gevent.timeout import Timeout
 
 is_windows = sys.platform == 'win32'
@@ -114,20 +114,22 @@ _realsocket = _socket.socket
 __socket__ = __import__('socket')
 _fileobject = __socket__._fileobject
 
+_globals = globals()
+
 for name in __imports__[:]:
     try:
         value = getattr(__socket__, name)
-        globals()[name] = value
+        _globals[name] = value
     except AttributeError:
         __imports__.remove(name)
 
 for name in __socket__.__all__:
     value = getattr(__socket__, name)
     if isinstance(value, (int, long, basestring)):
-        globals()[name] = value
+        _globals[name] = value
         __imports__.append(name)
 
-del name, value
+del name, value, _globals
 
 
 def wait(io, timeout=None, timeout_exc=timeout('timed out')):
@@ -186,6 +188,7 @@ def wait_readwrite(fileno, timeout=None, timeout_exc=timeout('timed out'), event
 
 
 cancel_wait_ex = error(EBADF, 'File descriptor was closed in another greenlet')
+_timeout_error = timeout('timed out')
 
 
 def cancel_wait(watcher):
@@ -226,15 +229,16 @@ class socket(object):
         if _sock is None:
             self._sock = _realsocket(family, type, proto)
             self.timeout = _socket.getdefaulttimeout()
-        else:
-            if hasattr(_sock, '_sock'):
-                self._sock = _sock._sock
-                self.timeout = getattr(_sock, 'timeout', False)
-                if self.timeout is False:
-                    self.timeout = _socket.getdefaulttimeout()
-            else:
-                self._sock = _sock
+        elif not isinstance(_sock, _realsocket) and hasattr(_sock, '_sock'):
+            # isinstance() first: accept() and dup() pass a plain _realsocket and
+            # a failed hasattr() probe costs more than the type check
+            self._sock = _sock._sock
+            self.timeout = getattr(_sock, 'timeout', False)
+            if self.timeout is False:
                 self.timeout = _socket.getdefaulttimeout()
+        else:
+            self._sock = _sock
+            self.timeout = _socket.getdefaulttimeout()
         self._sock.setblocking(0)
         fileno = self._sock.fileno()
         self.hub = get_hub()
@@ -299,7 +303,7 @@ class socket(object):
                 break
             except error:
                 ex = sys.exc_info()[1]
-                if ex[0] != EWOULDBLOCK or self.timeout == 0.0:
+                if ex.args[0] != EWOULDBLOCK or self.timeout == 0.0:
                     raise
                 sys.exc_clear()
             self._wait(self._read_event)
@@ -320,22 +324,22 @@ class socket(object):
             return self._sock.connect(address)
         sock = self._sock
         if isinstance(address, tuple):
-            r = getaddrinfo(address[0], address[1], sock.family, sock.type, sock.proto)
+            r = _getaddrinfo_numeric(address[0], address[1], sock.family, sock.type, sock.proto)
             address = r[0][-1]
         if self.timeout is not None:
-            timer = Timeout.start_new(self.timeout, timeout('timed out'))
+            timer = Timeout.start_new(self.timeout, _timeout_error)
         else:
             timer = None
         try:
             while True:
-                err = sock.getsockopt(SOL_SOCKET, SO_ERROR)
-                if err:
-                    raise error(err, strerror(err))
                 result = sock.connect_ex(address)
                 if not result or result == EISCONN:
                     break
                 elif (result in (EWOULDBLOCK, EINPROGRESS, EALREADY)) or (result == EINVAL and is_windows):
                     self._wait(self._write_event)
+                    err = sock.getsockopt(SOL_SOCKET, SO_ERROR)
+                    if err:
+                        raise error(err, strerror(err))
                 else:
                     raise error(result, strerror(result))
         finally:
@@ -372,10 +376,10 @@ class socket(object):
             try:
                 return sock.recv(*args)
             except error:
-                ex = sys.exc_info()[1]
-                if ex.args[0] == EBADF:
+                err = sys.exc_info()[1].args[0]
+                if err == EBADF:
                     return ''
-                if ex.args[0] != EWOULDBLOCK or self.timeout == 0.0:
+                if err != EWOULDBLOCK or self.timeout == 0.0:
                     raise
                 # QQQ without clearing exc_info test__refcount.test_clean_exit fails
                 sys.exc_clear()
@@ -417,10 +421,10 @@ class socket(object):
             try:
                 return sock.recv_into(*args)
             except error:
-                ex = sys.exc_info()[1]
-                if ex.args[0] == EBADF:
+                err = sys.exc_info()[1].args[0]
+                if err == EBADF:
                     return 0
-                if ex.args[0] != EWOULDBLOCK or self.timeout == 0.0:
+                if err != EWOULDBLOCK or self.timeout == 0.0:
                     raise
                 sys.exc_clear()
             try:
@@ -433,12 +437,12 @@ class socket(object):
 
     def send(self, data, flags=0, timeout=timeout_default):
         sock = self._sock
-        if timeout is timeout_default:
-            timeout = self.timeout
         try:
             return sock.send(data, flags)
         except error:
             ex = sys.exc_info()[1]
+            if timeout is timeout_default:
+                timeout = self.timeout
             if ex.args[0] != EWOULDBLOCK or timeout == 0.0:
                 raise
             sys.exc_clear()
@@ -532,11 +536,36 @@ class socket(object):
 
     # delegate the functions that we haven't implemented to the real socket object
 
-    _s = ("def %s(self, *args): return self._sock.%s(*args)\n\n"
-          "%s.__doc__ = _realsocket.%s.__doc__\n")
-    for _m in set(__socket__._socketmethods) - set(locals()):
-        exec (_s % (_m, _m, _m, _m))
-    del _m, _s
+    def bind(self, *args):
+        return self._sock.bind(*args)
+
+    def fileno(self, *args):
+        return self._sock.fileno(*args)
+
+    def listen(self, *args):
+        return self._sock.listen(*args)
+
+    def getpeername(self, *args):
+        return self._sock.getpeername(*args)
+
+    def getsockname(self, *args):
+        return self._sock.getsockname(*args)
+
+    def getsockopt(self, *args):
+        return self._sock.getsockopt(*args)
+
+    def setsockopt(self, *args):
+        return self._sock.setsockopt(*args)
+
+    if 'ioctl' in __socket__._socketmethods:
+
+        def ioctl(self, *args):
+            return self._sock.ioctl(*args)
+
+    for _m in ('bind', 'fileno', 'listen', 'getpeername', 'getsockname', 'getsockopt', 'setsockopt', 'ioctl'):
+        if _m in locals():
+            locals()[_m].__doc__ = getattr(_realsocket, _m).__doc__
+    del _m
 
 SocketType = socket
 
@@ -577,7 +606,7 @@ def create_connection(address, timeout=_GLOBAL_DEFAULT_TIMEOUT, source_address=N
 
     host, port = address
     err = None
-    for res in getaddrinfo(host, port, 0, SOCK_STREAM):
+    for res in _getaddrinfo_numeric(host, port, 0, SOCK_STREAM):
         af, socktype, proto, _canonname, sa = res
         sock = None
         try:
@@ -631,6 +660,16 @@ def getaddrinfo(host, port, family=0, socktype=0, proto=0, flags=0):
     return get_hub().resolver.getaddrinfo(host, port, family, socktype, proto, flags)
 
 
+def _getaddrinfo_numeric(host, port, family=0, socktype=0, proto=0):
+    """Like :func:`getaddrinfo`, but resolve numeric hosts in place, without going through the hub's resolver."""
+    try:
+        return _socket.getaddrinfo(host, port, family, socktype, proto, AI_NUMERICHOST)
+    except gaierror:
+        # not an IP address literal (or a lookup error that the resolver will report too)
+        sys.exc_clear()
+        return getaddrinfo(host, port, family, socktype, proto)
+
+
 def gethostbyaddr(ip_address):
     return get_hub().resolver.gethostbyaddr(ip_address)
 
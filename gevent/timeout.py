@@ -14,7 +14,7 @@ to arbitrary code.
 """
 
 import sys
-from gevent.hub import getcurrent, _NONE, get_hub, basestring
+from gevent.hub import getcurrent, _NONE, get_hub_noargs as get_hub, basestring
 
 __all__ = ['Timeout',
            'with_timeout']
@@ -30,6 +30,22 @@ except NameError:  # Python < 2.5
         pass
 
 
+class _FakeTimer(object):
+    # Mimics the part of the loop.timer API used by Timeout, for timeouts that never expire
+
+    pending = False
+    active = False
+
+    def start(self, *args, **kwargs):
+        raise AssertionError('a timeout without seconds cannot be started')
+
+    def stop(self):
+        pass
+
+
+_FakeTimer = _FakeTimer()
+
+
 class Timeout(BaseException):
     """Raise *exception* in the current greenlet after given time period::
 
@@ -89,7 +105,9 @@ class Timeout(BaseException):
         if seconds is not None:
             self.timer = get_hub().loop.timer(seconds)
         else:
-            self.timer = get_hub().loop.timer(0.0)
+            # Timeout.start_new(None) is used by join(), get() and friends; do not create
+            # a real watcher for a timeout that is never going to expire
+            self.timer = _FakeTimer
 
     def start(self):
         """Schedule the timeout."""
@@ -189,11 +207,10 @@ def with_timeout(seconds, function, *args, **kwds):
     timeout_value = kwds.pop("timeout_value", _NONE)
     timeout = Timeout.start_new(seconds)
     try:
-        try:
-            return function(*args, **kwds)
-        except Timeout:
-            if sys.exc_info()[1] is timeout and timeout_value is not _NONE:
-                return timeout_value
-            raise
+        return function(*args, **kwds)
+    except Timeout:
+        if sys.exc_info()[1] is timeout and timeout_value is not _NONE:
+            return timeout_value
+        raise
     finally:
         timeout.cancel()
@@ -81,6 +81,29 @@ class TestSleep(greentest.GenericWaitTestCase):
         gevent.sleep(0)
 
 
+class TestSwitchOut(greentest.TestCase):
+
+    def test(self):
+        switched_out = []
+
+        class MyGreenlet(gevent.Greenlet):
+
+            def switch_out(self):
+                switched_out.append(self)
+
+        g = MyGreenlet.spawn(gevent.sleep, 0.001)
+        g.join()
+        self.assertEqual(switched_out, [g])
+
+    def test_instance(self):
+        switched_out = []
+        g = gevent.Greenlet(gevent.sleep, 0.001)
+        g.switch_out = lambda: switched_out.append(g)
+        g.start()
+        g.join()
+        self.assertEqual(switched_out, [g])
+
+
 class TestWaiterGet(greentest.GenericWaitTestCase):
 
     def setUp(self):
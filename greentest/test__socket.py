@@ -185,6 +185,26 @@ class TestCreateConnection(greentest.TestCase):
         else:
             raise AssertionError('create_connection did not raise socket.error as expected')
 
+    def test_numeric_host(self):
+        # IP address literals must not go through the hub's resolver
+        class FailingResolver(object):
+
+            def getaddrinfo(self, *args):
+                raise AssertionError('resolver used for %r' % (args, ))
+
+        listener = socket.socket()
+        listener.bind(('127.0.0.1', 0))
+        listener.listen(1)
+        hub = gevent.get_hub()
+        old_resolver = hub._resolver
+        hub.resolver = FailingResolver()
+        try:
+            sock = socket.create_connection(listener.getsockname(), timeout=5)
+            sock.close()
+        finally:
+            hub.resolver = old_resolver
+            listener.close()
+
 
 class TestClosedSocket(greentest.TestCase):
 
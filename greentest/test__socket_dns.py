@@ -273,6 +273,7 @@ class Test1234(TestCase):
     switch_expected = None
 
 add(Test1234, '1.2.3.4')
+add(Test1234, u'1.2.3.4', 'unicode')
 
 
 class Test127001(TestCase):
@@ -58,6 +58,16 @@ class Test(greentest.TestCase):
         gevent.sleep(0.02)
         assert not timeout.pending, timeout
 
+    def test_none(self):
+        # a timeout that never expires does not allocate a libev timer
+        timeout = gevent.Timeout.start_new(None)
+        assert timeout.timer is gevent.timeout._FakeTimer, timeout.timer
+        assert gevent.Timeout(None).timer is timeout.timer, timeout.timer
+        assert not timeout.pending, timeout
+        gevent.sleep(DELAY)
+        timeout.cancel()
+        assert not timeout.pending, timeout
+
     def test_with_timeout(self):
         self.assertRaises(gevent.Timeout, gevent.with_timeout, DELAY, gevent.sleep, DELAY * 2)
         X = object()
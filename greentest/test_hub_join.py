@@ -1,14 +1,21 @@
 import gevent
 
+hub = gevent.get_hub()
+
 # hub.join() guarantees that loop has exited cleanly
 res = gevent.get_hub().join()
 assert res is True, res
 res = gevent.get_hub().join()
 assert res is True, res
 
+# the hub greenlet keeps running the loop between the joins, it is not restarted
+assert not hub.dead, hub
+assert gevent.get_hub() is hub, (gevent.get_hub(), hub)
+
 # but it is still possible to use gevent afterwards
 gevent.sleep(0.01)
 
 res = gevent.get_hub().join()
 assert res is True, res
+assert not hub.dead, hub
 